@@ -13,9 +13,12 @@ This script demonstrates the complete workflow:
 from pathlib import Path
 from src.reltools.parsers.sql_parser import parse_sql_file
 from src.reltools.parsers.ast_builder import ASTBuilder
-from src.reltools.converters.yaml_converter import ast_to_yaml, save_yaml
+from src.reltools.converters.yaml_converter import (
+    ast_to_yaml,
+    save_yaml,
+    schema_to_dict
+)
 from src.reltools.utils.validators import validate_schema, SchemaValidationError
-import yaml
 
 
 def main():
@@ -52,15 +55,15 @@ def main():
     # Convert to YAML
     print("\nStep 4: Converting to YAML format")
     print("-" * 60)
-    yaml_output = ast_to_yaml(schema)
+    schema_dict = schema_to_dict(schema)
+    yaml_output = ast_to_yaml(schema_dict)
     print(yaml_output)
 
     # Validate schema
     print("\nStep 5: Validating schema structure")
     print("-" * 60)
-    yaml_data = yaml.safe_load(yaml_output)
     try:
-        validate_schema(yaml_data)
+        validate_schema(schema_dict)
         print("✓ Schema validation passed!")
     except SchemaValidationError as e:
         print(f"✗ Schema validation failed: {e}")
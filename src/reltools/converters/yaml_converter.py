@@ -7,6 +7,21 @@ import yaml
 from typing import Dict, Any, Union
 from ..models.schema import Schema
 
+# Prefer the libyaml-backed dumper; fall back to the pure-Python one
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+# Formatting shared by string and file output
+_DUMP_OPTIONS = {
+    'Dumper': _Dumper,
+    'default_flow_style': False,
+    'sort_keys': False,
+    'allow_unicode': True,
+    'indent': 2
+}
+
 
 def ast_to_yaml(ast: Union[Schema, Dict[str, Any]]) -> str:
     """
@@ -19,19 +34,10 @@ def ast_to_yaml(ast: Union[Schema, Dict[str, Any]]) -> str:
         YAML string representation
     """
     # Convert Schema object to dictionary if needed
-    if isinstance(ast, Schema):
-        schema_dict = schema_to_dict(ast)
-    else:
-        schema_dict = ast
+    schema_dict = _as_schema_dict(ast)
 
     # Convert to YAML with proper formatting
-    yaml_str = yaml.dump(
-        schema_dict,
-        default_flow_style=False,
-        sort_keys=False,
-        allow_unicode=True,
-        indent=2
-    )
+    yaml_str = yaml.dump(schema_dict, **_DUMP_OPTIONS)
 
     return yaml_str
 
@@ -46,42 +52,36 @@ def schema_to_dict(schema: Schema) -> Dict[str, Any]:
     Returns:
         Dictionary representation
     """
-    tables_list = []
-
-    for table in schema.tables:
-        table_dict = {
-            'name': table.name,
-            'columns': []
-        }
-
-        # Add columns
-        for col in table.columns:
-            col_dict = {
-                'name': col.name,
-                'type': col.type
+    # Key order matters for the YAML output: constraints and foreign_keys
+    # are only emitted when present
+    return {
+        'tables': [
+            {
+                'name': table.name,
+                'columns': [
+                    {
+                        'name': col.name,
+                        'type': col.type,
+                        **({'constraints': col.constraints} if col.constraints else {})
+                    }
+                    for col in table.columns
+                ],
+                'primary_key': table.primary_key,
+                **({
+                    'foreign_keys': [
+                        {
+                            'name': fk.name,
+                            'columns': fk.columns,
+                            'ref_table': fk.ref_table,
+                            'ref_columns': fk.ref_columns
+                        }
+                        for fk in table.foreign_keys
+                    ]
+                } if table.foreign_keys else {})
             }
-            if col.constraints:
-                col_dict['constraints'] = col.constraints
-            table_dict['columns'].append(col_dict)
-
-        # Add primary key
-        table_dict['primary_key'] = table.primary_key
-
-        # Add foreign keys if present
-        if table.foreign_keys:
-            table_dict['foreign_keys'] = []
-            for fk in table.foreign_keys:
-                fk_dict = {
-                    'name': fk.name,
-                    'columns': fk.columns,
-                    'ref_table': fk.ref_table,
-                    'ref_columns': fk.ref_columns
-                }
-                table_dict['foreign_keys'].append(fk_dict)
-
-        tables_list.append(table_dict)
-
-    return {'tables': tables_list}
+            for table in schema.tables
+        ]
+    }
 
 
 def save_yaml(yaml_content: str, filepath: str) -> None:
@@ -94,3 +94,35 @@ def save_yaml(yaml_content: str, filepath: str) -> None:
     """
     with open(filepath, 'w', encoding='utf-8') as f:
         f.write(yaml_content)
+
+
+def save_schema_yaml(ast: Union[Schema, Dict[str, Any]], filepath: str) -> None:
+    """
+    Convert an AST to YAML and write it straight to a file.
+
+    Unlike ast_to_yaml followed by save_yaml, the document is streamed
+    into the file without building the full YAML string in memory.
+
+    Args:
+        ast: Abstract syntax tree representation (Schema object or dict)
+        filepath: Destination file path
+    """
+    schema_dict = _as_schema_dict(ast)
+
+    with open(filepath, 'w', encoding='utf-8') as f:
+        yaml.dump(schema_dict, f, **_DUMP_OPTIONS)
+
+
+def _as_schema_dict(ast: Union[Schema, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Return the dictionary form of an AST.
+
+    Args:
+        ast: Abstract syntax tree representation (Schema object or dict)
+
+    Returns:
+        The dict itself, or the converted Schema object
+    """
+    if isinstance(ast, Schema):
+        return schema_to_dict(ast)
+    return ast
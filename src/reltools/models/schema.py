@@ -4,11 +4,15 @@ Data classes representing database schema elements like tables,
 columns, constraints, etc.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Column:
     """Represents a database column."""
     name: str
@@ -16,7 +20,7 @@ class Column:
     constraints: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ForeignKey:
     """Represents a foreign key constraint."""
     name: str
@@ -25,7 +29,7 @@ class ForeignKey:
     ref_columns: List[str]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Table:
     """Represents a database table."""
     name: str
@@ -34,7 +38,7 @@ class Table:
     foreign_keys: List[ForeignKey] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Schema:
     """Represents a complete database schema."""
     tables: List[Table]
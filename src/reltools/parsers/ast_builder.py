@@ -24,11 +24,10 @@ class ASTBuilder:
         Returns:
             Schema object representing the database schema
         """
-        tables = []
-
-        for table_dict in parsed_sql.get('tables', []):
-            table = self._build_table(table_dict)
-            tables.append(table)
+        tables = [
+            self._build_table(table_dict)
+            for table_dict in parsed_sql.get('tables', [])
+        ]
 
         return Schema(tables=tables)
 
@@ -42,26 +41,25 @@ class ASTBuilder:
         Returns:
             Table object
         """
-        columns = []
-        for col_dict in table_dict.get('columns', []):
-            # Remove 'is_primary_key' as it's not part of the Column model
-            col_data = {
-                'name': col_dict['name'],
-                'type': col_dict['type'],
-                'constraints': col_dict.get('constraints')
-            }
-            column = Column(**col_data)
-            columns.append(column)
+        # 'is_primary_key' is dropped as it's not part of the Column model
+        columns = [
+            Column(
+                name=col_dict['name'],
+                type=col_dict['type'],
+                constraints=col_dict.get('constraints')
+            )
+            for col_dict in table_dict.get('columns', [])
+        ]
 
-        foreign_keys = []
-        for fk_dict in table_dict.get('foreign_keys', []):
-            foreign_key = ForeignKey(
+        foreign_keys = [
+            ForeignKey(
                 name=fk_dict['name'],
                 columns=fk_dict['columns'],
                 ref_table=fk_dict['ref_table'],
                 ref_columns=fk_dict['ref_columns']
             )
-            foreign_keys.append(foreign_key)
+            for fk_dict in table_dict.get('foreign_keys', [])
+        ]
 
         return Table(
             name=table_dict['name'],
@@ -4,19 +4,57 @@ Parses SQL DDL statements (CREATE TABLE, etc.) and converts them
 into an abstract syntax tree representation.
 """
 
+import copy
+import os
 import re
-from typing import Dict, List, Any
+import sys
+from functools import lru_cache
+from typing import Dict, Iterator, List, Any
 import sqlparse
-from sqlparse.sql import Statement
-from sqlparse.tokens import Keyword, DDL, Name
+from sqlparse.sql import Statement, Parenthesis
+from sqlparse.tokens import Keyword, DDL, Name, Punctuation
+
+# Precompiled patterns used while parsing table definitions
+_PK_RE = re.compile(r'PRIMARY\s+KEY', re.IGNORECASE)
+_PK_COLS_RE = re.compile(r'PRIMARY\s+KEY\s*\(([^)]+)\)', re.IGNORECASE)
+_FK_RE = re.compile(
+    r'(?:CONSTRAINT\s+(?P<name>\S+)\s+)?'
+    r'FOREIGN\s+KEY\s*\((?P<cols>[^)]+)\)\s*'
+    r'REFERENCES\s+(?P<ref_table>[^\s(]+)\s*\((?P<ref_cols>[^)]+)\)',
+    re.IGNORECASE
+)
+_COLUMN_RE = re.compile(r'(\S+)\s+([^\s(]+(?:\([^)]*\))?)(.*)', re.DOTALL)
 
 
 def parse_sql_file(filepath: str) -> Dict[str, Any]:
     """
     Parse a SQL file containing DDL statements.
 
+    Results are cached per file and reused as long as the file's
+    modification time and size are unchanged.
+
+    Args:
+        filepath: Path to the SQL file
+
+    Returns:
+        Dictionary representing the parsed SQL structure
+    """
+    filepath = os.path.abspath(filepath)
+    st = os.stat(filepath)
+    parsed = _parse_sql_file_cached(filepath, st.st_mtime_ns, st.st_size)
+    # Hand out a copy so callers cannot alter the cached result
+    return copy.deepcopy(parsed)
+
+
+@lru_cache(maxsize=32)
+def _parse_sql_file_cached(filepath: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Read and parse a SQL file; mtime_ns and size only serve as cache key.
+
     Args:
         filepath: Path to the SQL file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: File size in bytes
 
     Returns:
         Dictionary representing the parsed SQL structure
@@ -58,7 +96,6 @@ def _parse_create_table(stmt: Statement) -> Dict[str, Any]:
     Returns:
         Dictionary with table definition
     """
-    tokens = list(stmt.flatten())
     table_name = None
     columns = []
     primary_key = []
@@ -66,57 +103,26 @@ def _parse_create_table(stmt: Statement) -> Dict[str, Any]:
 
     # Find table name
     in_table_name = False
-    for token in tokens:
+    for token in stmt.flatten():
         if token.ttype is DDL and token.value.upper() == 'CREATE':
             continue
         if token.ttype is Keyword and token.value.upper() == 'TABLE':
             in_table_name = True
             continue
         if in_table_name and token.ttype is Name and not token.is_whitespace:
-            table_name = token.value.strip('`"[]')
+            table_name = _unquote(token.value)
             break
 
-    # Parse column definitions and constraints
-    stmt_str = str(stmt)
-
-    # Extract content between parentheses
-    paren_match = re.search(r'\((.*)\)', stmt_str, re.DOTALL)
-    if paren_match:
-        definitions = paren_match.group(1)
-
-        # Split by commas (but not within parentheses)
-        parts = _split_by_comma(definitions)
-
-        for part in parts:
-            part = part.strip()
-
-            # Check for PRIMARY KEY constraint
-            if re.match(r'PRIMARY\s+KEY', part, re.IGNORECASE):
-                pk_match = re.search(r'PRIMARY\s+KEY\s*\(([^)]+)\)', part, re.IGNORECASE)
-                if pk_match:
-                    pk_cols = [col.strip().strip('`"[]') for col in pk_match.group(1).split(',')]
-                    primary_key.extend(pk_cols)
-
-            # Check for FOREIGN KEY constraint
-            elif re.match(r'FOREIGN\s+KEY', part, re.IGNORECASE):
-                fk_def = _parse_foreign_key(part)
-                if fk_def:
-                    foreign_keys.append(fk_def)
-
-            # Check for CONSTRAINT with named foreign key
-            elif re.match(r'CONSTRAINT', part, re.IGNORECASE):
-                fk_def = _parse_foreign_key(part)
-                if fk_def:
-                    foreign_keys.append(fk_def)
-
-            # Parse column definition
-            else:
-                col_def = _parse_column_definition(part)
-                if col_def:
-                    columns.append(col_def)
-                    # Check for inline PRIMARY KEY
-                    if col_def.get('is_primary_key'):
-                        primary_key.append(col_def['name'])
+    # Parse column definitions and constraints from the table body
+    paren = next((t for t in stmt.tokens if isinstance(t, Parenthesis)), None)
+    if paren is not None:
+        for part in _split_definitions(paren):
+            # Classify the part by its leading keyword
+            words = part.split(None, 1)
+            if not words:
+                continue
+            handler = _DEFINITION_HANDLERS.get(words[0].upper(), _handle_column)
+            handler(part.strip(), columns, primary_key, foreign_keys)
 
     if not table_name:
         return None
@@ -129,6 +135,77 @@ def _parse_create_table(stmt: Statement) -> Dict[str, Any]:
     }
 
 
+def _handle_primary_key(
+    part: str,
+    columns: List[Dict[str, Any]],
+    primary_key: List[str],
+    foreign_keys: List[Dict[str, Any]]
+) -> None:
+    """
+    Collect the columns of a table-level PRIMARY KEY constraint.
+
+    Args:
+        part: Definition part, stripped of surrounding whitespace
+        columns: Column definitions collected so far
+        primary_key: Primary key column names collected so far
+        foreign_keys: Foreign key definitions collected so far
+    """
+    pk_match = _PK_COLS_RE.match(part)
+    if pk_match:
+        pk_cols = [_unquote(col.strip()) for col in pk_match.group(1).split(',')]
+        primary_key.extend(pk_cols)
+
+
+def _handle_foreign_key(
+    part: str,
+    columns: List[Dict[str, Any]],
+    primary_key: List[str],
+    foreign_keys: List[Dict[str, Any]]
+) -> None:
+    """
+    Collect a FOREIGN KEY constraint, optionally named via CONSTRAINT.
+
+    Args:
+        part: Definition part, stripped of surrounding whitespace
+        columns: Column definitions collected so far
+        primary_key: Primary key column names collected so far
+        foreign_keys: Foreign key definitions collected so far
+    """
+    fk_def = _parse_foreign_key(part)
+    if fk_def:
+        foreign_keys.append(fk_def)
+
+
+def _handle_column(
+    part: str,
+    columns: List[Dict[str, Any]],
+    primary_key: List[str],
+    foreign_keys: List[Dict[str, Any]]
+) -> None:
+    """
+    Collect a column definition and its inline PRIMARY KEY, if any.
+
+    Args:
+        part: Definition part, stripped of surrounding whitespace
+        columns: Column definitions collected so far
+        primary_key: Primary key column names collected so far
+        foreign_keys: Foreign key definitions collected so far
+    """
+    col_def = _parse_column_definition(part)
+    if col_def:
+        columns.append(col_def)
+        if col_def.get('is_primary_key'):
+            primary_key.append(col_def['name'])
+
+
+# Leading keyword of a table body part -> handler; anything else is a column
+_DEFINITION_HANDLERS = {
+    'PRIMARY': _handle_primary_key,
+    'FOREIGN': _handle_foreign_key,
+    'CONSTRAINT': _handle_foreign_key,
+}
+
+
 def _parse_column_definition(col_def: str) -> Dict[str, Any]:
     """
     Parse a column definition.
@@ -139,33 +216,33 @@ def _parse_column_definition(col_def: str) -> Dict[str, Any]:
     Returns:
         Dictionary with column information
     """
-    # Match column_name datatype [constraints]
-    parts = col_def.split(None, 2)
-
-    if len(parts) < 2:
+    # Match column_name datatype [constraints] in a single scan
+    col_match = _COLUMN_RE.match(col_def)
+    if not col_match:
         return None
 
-    col_name = parts[0].strip('`"[]')
-    col_type = parts[1].upper()
+    col_name, col_type, constraints_str = col_match.groups()
+    if not col_type.isupper():
+        col_type = col_type.upper()
 
-    # Check for type with parameters like VARCHAR(50)
-    type_match = re.match(r'([A-Z]+)(\([^)]+\))?', parts[1], re.IGNORECASE)
-    if type_match:
-        col_type = type_match.group(0).upper()
+    # Type names and common column names repeat across tables; share them
+    col_name = sys.intern(_unquote(col_name))
+    col_type = sys.intern(col_type)
 
     constraints = None
     is_primary_key = False
 
-    if len(parts) > 2:
-        constraints_str = parts[2].strip()
-        # Check for PRIMARY KEY
-        if re.search(r'PRIMARY\s+KEY', constraints_str, re.IGNORECASE):
-            is_primary_key = True
-            # Remove PRIMARY KEY from constraints string
-            constraints_str = re.sub(r'PRIMARY\s+KEY', '', constraints_str, flags=re.IGNORECASE).strip()
+    # Check for PRIMARY KEY and splice it out of the constraints
+    pk_match = _PK_RE.search(constraints_str)
+    if pk_match:
+        is_primary_key = True
+        head = constraints_str[:pk_match.start()].strip()
+        tail = constraints_str[pk_match.end():].strip()
+        constraints_str = f"{head} {tail}"
 
-        if constraints_str:
-            constraints = constraints_str
+    constraints_str = constraints_str.strip()
+    if constraints_str:
+        constraints = constraints_str
 
     return {
         'name': col_name,
@@ -185,24 +262,15 @@ def _parse_foreign_key(fk_def: str) -> Dict[str, Any]:
     Returns:
         Dictionary with foreign key information
     """
-    # Extract constraint name if present
-    name_match = re.search(r'CONSTRAINT\s+([^\s]+)', fk_def, re.IGNORECASE)
-    fk_name = name_match.group(1).strip('`"[]') if name_match else None
-
-    # Extract FOREIGN KEY columns
-    fk_cols_match = re.search(r'FOREIGN\s+KEY\s*\(([^)]+)\)', fk_def, re.IGNORECASE)
-    if not fk_cols_match:
-        return None
-
-    fk_columns = [col.strip().strip('`"[]') for col in fk_cols_match.group(1).split(',')]
-
-    # Extract REFERENCES table and columns
-    ref_match = re.search(r'REFERENCES\s+([^\s(]+)\s*\(([^)]+)\)', fk_def, re.IGNORECASE)
-    if not ref_match:
+    # Extract constraint name, columns and referenced table in one match
+    fk_match = _FK_RE.match(fk_def)
+    if not fk_match:
         return None
 
-    ref_table = ref_match.group(1).strip('`"[]')
-    ref_columns = [col.strip().strip('`"[]') for col in ref_match.group(2).split(',')]
+    fk_name = _unquote(fk_match.group('name')) if fk_match.group('name') else None
+    fk_columns = [_unquote(col.strip()) for col in fk_match.group('cols').split(',')]
+    ref_table = _unquote(fk_match.group('ref_table'))
+    ref_columns = [_unquote(col.strip()) for col in fk_match.group('ref_cols').split(',')]
 
     # Generate a name if not provided
     if not fk_name:
@@ -216,34 +284,58 @@ def _parse_foreign_key(fk_def: str) -> Dict[str, Any]:
     }
 
 
-def _split_by_comma(text: str) -> List[str]:
+def _split_definitions(paren: Parenthesis) -> Iterator[str]:
     """
-    Split text by commas, but not within parentheses.
+    Split the body of a table definition into its comma-separated parts.
+
+    Walks the already tokenized parenthesis once, tracking offsets into
+    its source text, and yields slices at commas that are not nested
+    inside further parentheses.
 
     Args:
-        text: Text to split
+        paren: Parenthesis token holding the table body
 
-    Returns:
-        List of parts
+    Yields:
+        Definition parts
     """
-    parts = []
-    current = []
+    text = paren.value
+    start = 0
+    pos = 0
     paren_depth = 0
 
-    for char in text:
-        if char == '(':
-            paren_depth += 1
-            current.append(char)
-        elif char == ')':
-            paren_depth -= 1
-            current.append(char)
-        elif char == ',' and paren_depth == 0:
-            parts.append(''.join(current))
-            current = []
-        else:
-            current.append(char)
-
-    if current:
-        parts.append(''.join(current))
-
-    return parts
+    for token in paren.flatten():
+        if token.ttype is Punctuation:
+            if token.value == '(':
+                paren_depth += 1
+                if paren_depth == 1:
+                    start = pos + 1
+            elif token.value == ')':
+                paren_depth -= 1
+                if paren_depth == 0 and start < pos:
+                    yield text[start:pos]
+            elif token.value == ',' and paren_depth == 1:
+                yield text[start:pos]
+                start = pos + 1
+        pos += len(token.value)
+
+
+# Opening quote character -> matching closing one
+_QUOTE_PAIRS = {'`': '`', '"': '"', '[': ']'}
+
+
+def _unquote(identifier: str) -> str:
+    """
+    Remove the quotes around an identifier, if any.
+
+    Only the first and last characters are inspected, so unquoted
+    identifiers are returned without scanning them.
+
+    Args:
+        identifier: Possibly quoted identifier
+
+    Returns:
+        Identifier without surrounding quotes
+    """
+    if len(identifier) > 1 and _QUOTE_PAIRS.get(identifier[0]) == identifier[-1]:
+        return identifier[1:-1]
+    return identifier
@@ -8,6 +8,10 @@ class SchemaValidationError(Exception):
     pass
 
 
+# Sentinel distinguishing a missing key from one explicitly set to None
+_MISSING = object()
+
+
 def validate_schema(schema: Dict[str, Any]) -> bool:
     """
     Validate a schema dictionary structure.
@@ -24,10 +28,10 @@ def validate_schema(schema: Dict[str, Any]) -> bool:
     if not isinstance(schema, dict):
         raise SchemaValidationError("Schema must be a dictionary")
 
-    if 'tables' not in schema:
+    tables = schema.get('tables', _MISSING)
+    if tables is _MISSING:
         raise SchemaValidationError("Schema must have 'tables' key")
 
-    tables = schema['tables']
     if not isinstance(tables, list):
         raise SchemaValidationError("'tables' must be a list")
 
@@ -37,9 +41,10 @@ def validate_schema(schema: Dict[str, Any]) -> bool:
 
     # First pass: validate tables and collect names/columns
     for i, table in enumerate(tables):
-        _validate_table(table, i)
-        table_names.add(table['name'])
-        table_columns[table['name']] = {col['name'] for col in table['columns']}
+        column_names = _validate_table(table, i)
+        name = table['name']
+        table_names.add(name)
+        table_columns[name] = column_names
 
     # Second pass: validate foreign key references
     for table in tables:
@@ -48,7 +53,7 @@ def validate_schema(schema: Dict[str, Any]) -> bool:
     return True
 
 
-def _validate_table(table: Dict[str, Any], index: int) -> None:
+def _validate_table(table: Dict[str, Any], index: int) -> Set[str]:
     """
     Validate a single table definition.
 
@@ -56,6 +61,9 @@ def _validate_table(table: Dict[str, Any], index: int) -> None:
         table: Table dictionary
         index: Table index in the list
 
+    Returns:
+        Set of the table's column names
+
     Raises:
         SchemaValidationError: If table is invalid
     """
@@ -63,49 +71,52 @@ def _validate_table(table: Dict[str, Any], index: int) -> None:
         raise SchemaValidationError(f"Table at index {index} must be a dictionary")
 
     # Check required fields
-    if 'name' not in table:
+    name = table.get('name', _MISSING)
+    if name is _MISSING:
         raise SchemaValidationError(f"Table at index {index} must have 'name' field")
 
-    if 'columns' not in table:
-        raise SchemaValidationError(f"Table '{table['name']}' must have 'columns' field")
+    columns = table.get('columns', _MISSING)
+    if columns is _MISSING:
+        raise SchemaValidationError(f"Table '{name}' must have 'columns' field")
 
-    if 'primary_key' not in table:
-        raise SchemaValidationError(f"Table '{table['name']}' must have 'primary_key' field")
+    primary_key = table.get('primary_key', _MISSING)
+    if primary_key is _MISSING:
+        raise SchemaValidationError(f"Table '{name}' must have 'primary_key' field")
 
     # Validate name
-    if not isinstance(table['name'], str) or not table['name']:
+    if not isinstance(name, str) or not name:
         raise SchemaValidationError(f"Table name at index {index} must be a non-empty string")
 
     # Validate columns
-    columns = table['columns']
     if not isinstance(columns, list):
-        raise SchemaValidationError(f"Table '{table['name']}' columns must be a list")
+        raise SchemaValidationError(f"Table '{name}' columns must be a list")
 
     if not columns:
-        raise SchemaValidationError(f"Table '{table['name']}' must have at least one column")
+        raise SchemaValidationError(f"Table '{name}' must have at least one column")
 
     column_names = set()
     for col_idx, column in enumerate(columns):
-        _validate_column(column, table['name'], col_idx)
-        if column['name'] in column_names:
+        col_name = _validate_column(column, name, col_idx)
+        if col_name in column_names:
             raise SchemaValidationError(
-                f"Duplicate column name '{column['name']}' in table '{table['name']}'"
+                f"Duplicate column name '{col_name}' in table '{name}'"
             )
-        column_names.add(column['name'])
+        column_names.add(col_name)
 
     # Validate primary key
-    primary_key = table['primary_key']
     if not isinstance(primary_key, list):
-        raise SchemaValidationError(f"Table '{table['name']}' primary_key must be a list")
+        raise SchemaValidationError(f"Table '{name}' primary_key must be a list")
 
     for pk_col in primary_key:
         if pk_col not in column_names:
             raise SchemaValidationError(
-                f"Primary key column '{pk_col}' not found in table '{table['name']}'"
+                f"Primary key column '{pk_col}' not found in table '{name}'"
             )
 
+    return column_names
+
 
-def _validate_column(column: Dict[str, Any], table_name: str, index: int) -> None:
+def _validate_column(column: Dict[str, Any], table_name: str, index: int) -> str:
     """
     Validate a single column definition.
 
@@ -114,6 +125,9 @@ def _validate_column(column: Dict[str, Any], table_name: str, index: int) -> Non
         table_name: Name of the parent table
         index: Column index in the list
 
+    Returns:
+        The column name
+
     Raises:
         SchemaValidationError: If column is invalid
     """
@@ -123,35 +137,38 @@ def _validate_column(column: Dict[str, Any], table_name: str, index: int) -> Non
         )
 
     # Check required fields
-    if 'name' not in column:
+    name = column.get('name', _MISSING)
+    if name is _MISSING:
         raise SchemaValidationError(
             f"Column at index {index} in table '{table_name}' must have 'name' field"
         )
 
-    if 'type' not in column:
+    col_type = column.get('type', _MISSING)
+    if col_type is _MISSING:
         raise SchemaValidationError(
-            f"Column '{column.get('name', f'at index {index}')}' in table '{table_name}' "
-            f"must have 'type' field"
+            f"Column '{name}' in table '{table_name}' must have 'type' field"
         )
 
     # Validate name
-    if not isinstance(column['name'], str) or not column['name']:
+    if not isinstance(name, str) or not name:
         raise SchemaValidationError(
             f"Column name at index {index} in table '{table_name}' must be a non-empty string"
         )
 
     # Validate type
-    if not isinstance(column['type'], str) or not column['type']:
+    if not isinstance(col_type, str) or not col_type:
         raise SchemaValidationError(
-            f"Column '{column['name']}' type in table '{table_name}' must be a non-empty string"
+            f"Column '{name}' type in table '{table_name}' must be a non-empty string"
         )
 
     # Validate constraints if present
-    if 'constraints' in column and column['constraints'] is not None:
-        if not isinstance(column['constraints'], str):
-            raise SchemaValidationError(
-                f"Column '{column['name']}' constraints in table '{table_name}' must be a string"
-            )
+    constraints = column.get('constraints')
+    if constraints is not None and not isinstance(constraints, str):
+        raise SchemaValidationError(
+            f"Column '{name}' constraints in table '{table_name}' must be a string"
+        )
+
+    return name
 
 
 def _validate_foreign_keys(
@@ -170,10 +187,10 @@ def _validate_foreign_keys(
     Raises:
         SchemaValidationError: If foreign keys are invalid
     """
-    if 'foreign_keys' not in table:
+    foreign_keys = table.get('foreign_keys', _MISSING)
+    if foreign_keys is _MISSING:
         return
 
-    foreign_keys = table['foreign_keys']
     if not isinstance(foreign_keys, list):
         raise SchemaValidationError(f"Table '{table['name']}' foreign_keys must be a list")
 
@@ -202,6 +219,7 @@ def _validate_foreign_key(
         SchemaValidationError: If foreign key is invalid
     """
     table_name = table['name']
+    own_columns = table_columns[table_name]
 
     if not isinstance(fk, dict):
         raise SchemaValidationError(
@@ -209,62 +227,71 @@ def _validate_foreign_key(
         )
 
     # Check required fields
-    required_fields = ['name', 'columns', 'ref_table', 'ref_columns']
-    for field in required_fields:
-        if field not in fk:
+    fk_name = fk.get('name', _MISSING)
+    fk_columns = fk.get('columns', _MISSING)
+    ref_table = fk.get('ref_table', _MISSING)
+    ref_columns = fk.get('ref_columns', _MISSING)
+    for field, value in (
+        ('name', fk_name),
+        ('columns', fk_columns),
+        ('ref_table', ref_table),
+        ('ref_columns', ref_columns)
+    ):
+        if value is _MISSING:
             raise SchemaValidationError(
                 f"Foreign key at index {index} in table '{table_name}' must have '{field}' field"
             )
 
     # Validate name
-    if not isinstance(fk['name'], str) or not fk['name']:
+    if not isinstance(fk_name, str) or not fk_name:
         raise SchemaValidationError(
             f"Foreign key name at index {index} in table '{table_name}' must be a non-empty string"
         )
 
     # Validate columns
-    if not isinstance(fk['columns'], list) or not fk['columns']:
+    if not isinstance(fk_columns, list) or not fk_columns:
         raise SchemaValidationError(
-            f"Foreign key '{fk['name']}' columns in table '{table_name}' must be a non-empty list"
+            f"Foreign key '{fk_name}' columns in table '{table_name}' must be a non-empty list"
         )
 
-    for col in fk['columns']:
-        if col not in table_columns[table_name]:
+    for col in fk_columns:
+        if col not in own_columns:
             raise SchemaValidationError(
-                f"Foreign key '{fk['name']}' references non-existent column '{col}' "
+                f"Foreign key '{fk_name}' references non-existent column '{col}' "
                 f"in table '{table_name}'"
             )
 
     # Validate ref_table
-    if not isinstance(fk['ref_table'], str) or not fk['ref_table']:
+    if not isinstance(ref_table, str) or not ref_table:
         raise SchemaValidationError(
-            f"Foreign key '{fk['name']}' ref_table in table '{table_name}' "
+            f"Foreign key '{fk_name}' ref_table in table '{table_name}' "
             f"must be a non-empty string"
         )
 
-    if fk['ref_table'] not in table_names:
+    if ref_table not in table_names:
         raise SchemaValidationError(
-            f"Foreign key '{fk['name']}' in table '{table_name}' references "
-            f"non-existent table '{fk['ref_table']}'"
+            f"Foreign key '{fk_name}' in table '{table_name}' references "
+            f"non-existent table '{ref_table}'"
         )
 
     # Validate ref_columns
-    if not isinstance(fk['ref_columns'], list) or not fk['ref_columns']:
+    if not isinstance(ref_columns, list) or not ref_columns:
         raise SchemaValidationError(
-            f"Foreign key '{fk['name']}' ref_columns in table '{table_name}' "
+            f"Foreign key '{fk_name}' ref_columns in table '{table_name}' "
             f"must be a non-empty list"
         )
 
-    for col in fk['ref_columns']:
-        if col not in table_columns[fk['ref_table']]:
+    ref_table_columns = table_columns[ref_table]
+    for col in ref_columns:
+        if col not in ref_table_columns:
             raise SchemaValidationError(
-                f"Foreign key '{fk['name']}' in table '{table_name}' references "
-                f"non-existent column '{col}' in table '{fk['ref_table']}'"
+                f"Foreign key '{fk_name}' in table '{table_name}' references "
+                f"non-existent column '{col}' in table '{ref_table}'"
             )
 
     # Validate that columns and ref_columns have same length
-    if len(fk['columns']) != len(fk['ref_columns']):
+    if len(fk_columns) != len(ref_columns):
         raise SchemaValidationError(
-            f"Foreign key '{fk['name']}' in table '{table_name}' has mismatched "
-            f"column counts: {len(fk['columns'])} columns but {len(fk['ref_columns'])} ref_columns"
+            f"Foreign key '{fk_name}' in table '{table_name}' has mismatched "
+            f"column counts: {len(fk_columns)} columns but {len(ref_columns)} ref_columns"
         )
@@ -0,0 +1,39 @@
+"""Shared pytest fixtures."""
+
+import pytest
+from pathlib import Path
+from src.reltools.parsers.sql_parser import parse_sql_string
+from src.reltools.parsers.ast_builder import ASTBuilder
+from tests.yaml_helpers import load_yaml
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+
+@pytest.fixture(scope="session")
+def sample_ddl_text():
+    """Contents of sample_ddl.sql, read once per session."""
+    return (FIXTURES_DIR / 'sample_ddl.sql').read_text(encoding='utf-8')
+
+
+@pytest.fixture(scope="session")
+def sample_parsed(sample_ddl_text):
+    """Parsed sample_ddl.sql, shared by all tests (do not mutate)."""
+    return parse_sql_string(sample_ddl_text)
+
+
+@pytest.fixture(scope="session")
+def ast_builder():
+    """Shared ASTBuilder; it keeps no per-build state."""
+    return ASTBuilder()
+
+
+@pytest.fixture(scope="session")
+def sample_schema(sample_parsed, ast_builder):
+    """Schema built from sample_ddl.sql, shared by all tests (do not mutate)."""
+    return ast_builder.build(sample_parsed)
+
+
+@pytest.fixture(scope="session")
+def expected_yaml_data():
+    """Loaded expected_output.yaml, shared by all tests (do not mutate)."""
+    return load_yaml((FIXTURES_DIR / 'expected_output.yaml').read_text(encoding='utf-8'))
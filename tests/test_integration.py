@@ -1,29 +1,20 @@
 """Integration tests for complete SQL to YAML workflow."""
 
 import pytest
-import yaml
-from pathlib import Path
-from src.reltools.parsers.sql_parser import parse_sql_file
-from src.reltools.parsers.ast_builder import ASTBuilder
-from src.reltools.converters.yaml_converter import ast_to_yaml
+from src.reltools.parsers.sql_parser import parse_sql_string
+from src.reltools.converters.yaml_converter import ast_to_yaml, schema_to_dict
+from src.reltools.models.schema import Schema, Table, Column, ForeignKey
 from src.reltools.utils.validators import validate_schema, SchemaValidationError
+from tests.yaml_helpers import load_yaml
 
 
-def test_full_pipeline_sql_to_yaml():
+def test_full_pipeline_sql_to_yaml(sample_schema):
     """Test complete pipeline from SQL file to YAML."""
-    # Parse SQL file
-    test_file = Path(__file__).parent / 'fixtures' / 'sample_ddl.sql'
-    parsed_sql = parse_sql_file(str(test_file))
-
-    # Build AST
-    builder = ASTBuilder()
-    schema = builder.build(parsed_sql)
-
     # Convert to YAML
-    yaml_str = ast_to_yaml(schema)
+    yaml_str = ast_to_yaml(sample_schema)
 
     # Parse YAML and validate
-    yaml_data = yaml.safe_load(yaml_str)
+    yaml_data = load_yaml(yaml_str)
     assert validate_schema(yaml_data) is True
 
     # Verify content
@@ -32,8 +23,8 @@ def test_full_pipeline_sql_to_yaml():
     assert yaml_data['tables'][1]['name'] == 'orders'
 
 
-def test_roundtrip_sql_to_yaml_to_dict():
-    """Test roundtrip conversion maintains data integrity."""
+def test_sql_to_schema_dict(ast_builder):
+    """Test SQL to schema dict conversion maintains data integrity."""
     sql = """
     CREATE TABLE products (
         id INTEGER PRIMARY KEY,
@@ -51,52 +42,34 @@ def test_roundtrip_sql_to_yaml_to_dict():
     """
 
     # Parse and build
-    from src.reltools.parsers.sql_parser import parse_sql_string
-
     parsed = parse_sql_string(sql)
-    builder = ASTBuilder()
-    schema = builder.build(parsed)
+    schema = ast_builder.build(parsed)
 
-    # Convert to YAML and back
-    yaml_str = ast_to_yaml(schema)
-    yaml_data = yaml.safe_load(yaml_str)
+    # Convert to the dict form
+    schema_dict = schema_to_dict(schema)
 
     # Validate
-    assert validate_schema(yaml_data) is True
+    assert validate_schema(schema_dict) is True
 
     # Verify data integrity
-    assert yaml_data['tables'][0]['name'] == 'products'
-    assert yaml_data['tables'][0]['primary_key'] == ['id']
-    assert len(yaml_data['tables'][0]['columns']) == 4
+    assert schema_dict['tables'][0]['name'] == 'products'
+    assert schema_dict['tables'][0]['primary_key'] == ['id']
+    assert len(schema_dict['tables'][0]['columns']) == 4
 
-    assert yaml_data['tables'][1]['name'] == 'inventory'
-    assert len(yaml_data['tables'][1]['foreign_keys']) == 1
-    assert yaml_data['tables'][1]['foreign_keys'][0]['ref_table'] == 'products'
+    assert schema_dict['tables'][1]['name'] == 'inventory'
+    assert len(schema_dict['tables'][1]['foreign_keys']) == 1
+    assert schema_dict['tables'][1]['foreign_keys'][0]['ref_table'] == 'products'
 
 
-def test_expected_yaml_output_format():
+def test_expected_yaml_output_format(sample_schema, expected_yaml_data):
     """Test that output matches the expected YAML format from README."""
-    test_file = Path(__file__).parent / 'fixtures' / 'sample_ddl.sql'
-    expected_file = Path(__file__).parent / 'fixtures' / 'expected_output.yaml'
-
-    # Parse SQL
-    parsed_sql = parse_sql_file(str(test_file))
-
-    # Build AST
-    builder = ASTBuilder()
-    schema = builder.build(parsed_sql)
-
     # Convert to YAML
-    yaml_str = ast_to_yaml(schema)
-    actual_data = yaml.safe_load(yaml_str)
-
-    # Load expected output
-    with open(expected_file, 'r') as f:
-        expected_data = yaml.safe_load(f)
+    yaml_str = ast_to_yaml(sample_schema)
+    actual_data = load_yaml(yaml_str)
 
     # Compare structures (note: order matters for lists)
-    assert actual_data['tables'][0]['name'] == expected_data['tables'][0]['name']
-    assert actual_data['tables'][1]['name'] == expected_data['tables'][1]['name']
+    assert actual_data['tables'][0]['name'] == expected_yaml_data['tables'][0]['name']
+    assert actual_data['tables'][1]['name'] == expected_yaml_data['tables'][1]['name']
 
     # Validate the actual output
     assert validate_schema(actual_data) is True
@@ -105,8 +78,6 @@ def test_expected_yaml_output_format():
 def test_parse_validate_invalid_schema():
     """Test that invalid schemas are caught by validator."""
     # Create an intentionally invalid schema (foreign key to non-existent table)
-    from src.reltools.converters.yaml_converter import schema_to_dict
-    from src.reltools.models.schema import Schema, Table, Column, ForeignKey
 
     # Create orders table with FK to non-existent users table
     fk = ForeignKey(
@@ -134,7 +105,7 @@ def test_parse_validate_invalid_schema():
         validate_schema(schema_dict)
 
 
-def test_composite_keys_integration():
+def test_composite_keys_integration(ast_builder):
     """Test integration with composite primary and foreign keys."""
     sql = """
     CREATE TABLE course_sections (
@@ -154,13 +125,9 @@ def test_composite_keys_integration():
     );
     """
 
-    from src.reltools.parsers.sql_parser import parse_sql_string
-
     parsed = parse_sql_string(sql)
-    builder = ASTBuilder()
-    schema = builder.build(parsed)
-    yaml_str = ast_to_yaml(schema)
-    yaml_data = yaml.safe_load(yaml_str)
+    schema = ast_builder.build(parsed)
+    yaml_data = schema_to_dict(schema)
 
     # Validate
     assert validate_schema(yaml_data) is True
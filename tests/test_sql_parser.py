@@ -1,14 +1,12 @@
 """Tests for SQL parser module."""
 
 import pytest
-from pathlib import Path
 from src.reltools.parsers.sql_parser import parse_sql_file, parse_sql_string
 
 
-def test_parse_sql_file():
-    """Test parsing a SQL file."""
-    test_file = Path(__file__).parent / 'fixtures' / 'sample_ddl.sql'
-    result = parse_sql_file(str(test_file))
+def test_parse_sample_ddl(sample_parsed):
+    """Test parsing the sample DDL fixture."""
+    result = sample_parsed
 
     assert 'tables' in result
     assert len(result['tables']) == 2
@@ -40,6 +38,23 @@ def test_parse_sql_file():
     assert fk['ref_columns'] == ['id']
 
 
+def test_parse_sql_file_reparses_changed_file(tmp_path):
+    """Test that cached file results are refreshed when the file changes."""
+    sql_file = tmp_path / 'schema.sql'
+    sql_file.write_text("CREATE TABLE accounts (id INTEGER PRIMARY KEY);")
+
+    result = parse_sql_file(str(sql_file))
+    assert result['tables'][0]['name'] == 'accounts'
+
+    # Mutating a result must not leak into later calls
+    result['tables'].clear()
+    assert parse_sql_file(str(sql_file))['tables'][0]['name'] == 'accounts'
+
+    sql_file.write_text("CREATE TABLE customers (id INTEGER PRIMARY KEY);")
+    result = parse_sql_file(str(sql_file))
+    assert result['tables'][0]['name'] == 'customers'
+
+
 def test_parse_sql_string():
     """Test parsing a SQL string."""
     sql = """
@@ -98,35 +113,110 @@ def test_parse_multiple_tables():
     assert fk['ref_table'] == 'authors'
 
 
-def test_parse_composite_primary_key():
-    """Test parsing a composite primary key."""
+PRIMARY_KEY_CASES = [
+    pytest.param(
+        """
+        CREATE TABLE enrollment (
+            student_id INTEGER,
+            course_id INTEGER,
+            enrollment_date DATE,
+            PRIMARY KEY (student_id, course_id)
+        );
+        """,
+        'enrollment',
+        ['student_id', 'course_id'],
+        id='composite'
+    ),
+    pytest.param(
+        """
+        CREATE TABLE categories (
+            id INTEGER PRIMARY KEY,
+            name VARCHAR(50)
+        );
+        """,
+        'categories',
+        ['id'],
+        id='inline'
+    ),
+]
+
+
+@pytest.mark.parametrize("sql,table_name,primary_key", PRIMARY_KEY_CASES)
+def test_parse_primary_key(sql, table_name, primary_key):
+    """Test parsing composite and inline PRIMARY KEY constraints."""
+    result = parse_sql_string(sql)
+
+    table = result['tables'][0]
+    assert table['name'] == table_name
+    assert table['primary_key'] == primary_key
+
+
+def test_parse_column_named_like_constraint():
+    """Test that a column whose name starts with 'constraint' is kept."""
     sql = """
-    CREATE TABLE enrollment (
-        student_id INTEGER,
-        course_id INTEGER,
-        enrollment_date DATE,
-        PRIMARY KEY (student_id, course_id)
+    CREATE TABLE rules (
+        id INTEGER PRIMARY KEY,
+        constraint_id INTEGER NOT NULL
     );
     """
 
     result = parse_sql_string(sql)
 
-    table = result['tables'][0]
-    assert table['name'] == 'enrollment'
-    assert table['primary_key'] == ['student_id', 'course_id']
+    columns = result['tables'][0]['columns']
+    assert [col['name'] for col in columns] == ['id', 'constraint_id']
+    assert columns[1]['constraints'] == 'NOT NULL'
 
 
-def test_parse_inline_primary_key():
-    """Test parsing inline PRIMARY KEY constraint."""
+def test_parse_type_with_spaced_parameters():
+    """Test parsing a type whose parameters contain whitespace."""
     sql = """
-    CREATE TABLE categories (
+    CREATE TABLE prices (
         id INTEGER PRIMARY KEY,
-        name VARCHAR(50)
+        amount DECIMAL(10, 2) NOT NULL
+    );
+    """
+
+    result = parse_sql_string(sql)
+
+    amount = result['tables'][0]['columns'][1]
+    assert amount['type'] == 'DECIMAL(10, 2)'
+    assert amount['constraints'] == 'NOT NULL'
+
+
+def test_parse_quoted_identifiers():
+    """Test that surrounding identifier quotes are removed."""
+    sql = """
+    CREATE TABLE `orders` (
+        "id" INTEGER,
+        `name` VARCHAR(50) NOT NULL,
+        [customer_id] INTEGER,
+        PRIMARY KEY ("id"),
+        FOREIGN KEY ([customer_id]) REFERENCES `customers`("id")
     );
     """
 
     result = parse_sql_string(sql)
 
     table = result['tables'][0]
-    assert table['name'] == 'categories'
+    assert table['name'] == 'orders'
+    assert [col['name'] for col in table['columns']] == ['id', 'name', 'customer_id']
     assert table['primary_key'] == ['id']
+
+    fk = table['foreign_keys'][0]
+    assert fk['columns'] == ['customer_id']
+    assert fk['ref_table'] == 'customers'
+    assert fk['ref_columns'] == ['id']
+
+
+def test_parse_mismatched_quotes_are_kept():
+    """Test that quotes which do not form a matching pair are kept."""
+    sql = """
+    CREATE TABLE notes (
+        id INTEGER PRIMARY KEY,
+        [note` TEXT
+    );
+    """
+
+    result = parse_sql_string(sql)
+
+    assert result['tables'][0]['columns'][1]['name'] == '[note`'
@@ -1,5 +1,6 @@
 """Tests for schema validation module."""
 
+import re
 import pytest
 from src.reltools.utils.validators import validate_schema, SchemaValidationError
 
@@ -22,260 +23,126 @@ def test_validate_valid_schema():
     assert validate_schema(schema) is True
 
 
-def test_validate_schema_missing_tables_key():
-    """Test validation fails when 'tables' key is missing."""
-    schema = {'foo': 'bar'}
+def _schema(*tables):
+    """Wrap table dicts into a schema dict."""
+    return {'tables': list(tables)}
 
-    with pytest.raises(SchemaValidationError, match="must have 'tables' key"):
-        validate_schema(schema)
-
-
-def test_validate_schema_not_dict():
-    """Test validation fails when schema is not a dictionary."""
-    with pytest.raises(SchemaValidationError, match="must be a dictionary"):
-        validate_schema("not a dict")
-
-
-def test_validate_tables_not_list():
-    """Test validation fails when tables is not a list."""
-    schema = {'tables': 'not a list'}
-
-    with pytest.raises(SchemaValidationError, match="must be a list"):
-        validate_schema(schema)
-
-
-def test_validate_table_missing_name():
-    """Test validation fails when table lacks name."""
-    schema = {
-        'tables': [
-            {
-                'columns': [{'name': 'id', 'type': 'INTEGER'}],
-                'primary_key': ['id']
-            }
-        ]
-    }
-
-    with pytest.raises(SchemaValidationError, match="must have 'name' field"):
-        validate_schema(schema)
-
-
-def test_validate_table_missing_columns():
-    """Test validation fails when table lacks columns."""
-    schema = {
-        'tables': [
-            {
-                'name': 'users',
-                'primary_key': ['id']
-            }
-        ]
-    }
-
-    with pytest.raises(SchemaValidationError, match="must have 'columns' field"):
-        validate_schema(schema)
-
-
-def test_validate_table_missing_primary_key():
-    """Test validation fails when table lacks primary_key."""
-    schema = {
-        'tables': [
-            {
-                'name': 'users',
-                'columns': [{'name': 'id', 'type': 'INTEGER'}]
-            }
-        ]
-    }
-
-    with pytest.raises(SchemaValidationError, match="must have 'primary_key' field"):
-        validate_schema(schema)
-
-
-def test_validate_column_missing_name():
-    """Test validation fails when column lacks name."""
-    schema = {
-        'tables': [
-            {
-                'name': 'users',
-                'columns': [{'type': 'INTEGER'}],
-                'primary_key': []
-            }
-        ]
-    }
-
-    with pytest.raises(SchemaValidationError, match="must have 'name' field"):
-        validate_schema(schema)
-
-
-def test_validate_column_missing_type():
-    """Test validation fails when column lacks type."""
-    schema = {
-        'tables': [
-            {
-                'name': 'users',
-                'columns': [{'name': 'id'}],
-                'primary_key': []
-            }
-        ]
-    }
-
-    with pytest.raises(SchemaValidationError, match="must have 'type' field"):
-        validate_schema(schema)
-
-
-def test_validate_duplicate_column_names():
-    """Test validation fails with duplicate column names."""
-    schema = {
-        'tables': [
-            {
-                'name': 'users',
-                'columns': [
-                    {'name': 'id', 'type': 'INTEGER'},
-                    {'name': 'id', 'type': 'VARCHAR(50)'}
-                ],
-                'primary_key': ['id']
-            }
-        ]
-    }
-
-    with pytest.raises(SchemaValidationError, match="Duplicate column name"):
-        validate_schema(schema)
-
-
-def test_validate_primary_key_references_nonexistent_column():
-    """Test validation fails when primary key references non-existent column."""
-    schema = {
-        'tables': [
-            {
-                'name': 'users',
-                'columns': [{'name': 'id', 'type': 'INTEGER'}],
-                'primary_key': ['nonexistent']
-            }
-        ]
-    }
-
-    with pytest.raises(SchemaValidationError, match="Primary key column .* not found"):
-        validate_schema(schema)
 
-
-def test_validate_foreign_key_references_nonexistent_table():
-    """Test validation fails when foreign key references non-existent table."""
-    schema = {
-        'tables': [
-            {
-                'name': 'orders',
-                'columns': [
-                    {'name': 'id', 'type': 'INTEGER'},
-                    {'name': 'user_id', 'type': 'INTEGER'}
-                ],
-                'primary_key': ['id'],
-                'foreign_keys': [
-                    {
-                        'name': 'fk_user',
-                        'columns': ['user_id'],
-                        'ref_table': 'users',
-                        'ref_columns': ['id']
-                    }
-                ]
-            }
-        ]
+def _users(**overrides):
+    """Minimal valid users table, with fields replaced or dropped (None)."""
+    table = {
+        'name': 'users',
+        'columns': [{'name': 'id', 'type': 'INTEGER'}],
+        'primary_key': ['id']
     }
-
-    with pytest.raises(SchemaValidationError, match="references non-existent table"):
-        validate_schema(schema)
-
-
-def test_validate_foreign_key_references_nonexistent_column():
-    """Test validation fails when foreign key references non-existent column."""
-    schema = {
-        'tables': [
-            {
-                'name': 'users',
-                'columns': [{'name': 'id', 'type': 'INTEGER'}],
-                'primary_key': ['id']
-            },
-            {
-                'name': 'orders',
-                'columns': [
-                    {'name': 'id', 'type': 'INTEGER'},
-                    {'name': 'user_id', 'type': 'INTEGER'}
-                ],
-                'primary_key': ['id'],
-                'foreign_keys': [
-                    {
-                        'name': 'fk_user',
-                        'columns': ['user_id'],
-                        'ref_table': 'users',
-                        'ref_columns': ['nonexistent']
-                    }
-                ]
+    table.update(overrides)
+    return {key: value for key, value in table.items() if value is not None}
+
+
+def _orders(fk_columns, ref_columns, columns=('id', 'user_id')):
+    """Orders table with one foreign key to users."""
+    return {
+        'name': 'orders',
+        'columns': [{'name': name, 'type': 'INTEGER'} for name in columns],
+        'primary_key': ['id'],
+        'foreign_keys': [
+            {
+                'name': 'fk_user',
+                'columns': fk_columns,
+                'ref_table': 'users',
+                'ref_columns': ref_columns
             }
         ]
     }
 
-    with pytest.raises(SchemaValidationError, match="references non-existent column"):
-        validate_schema(schema)
-
-
-def test_validate_foreign_key_local_column_doesnt_exist():
-    """Test validation fails when foreign key local column doesn't exist."""
-    schema = {
-        'tables': [
-            {
-                'name': 'users',
-                'columns': [{'name': 'id', 'type': 'INTEGER'}],
-                'primary_key': ['id']
-            },
-            {
-                'name': 'orders',
-                'columns': [{'name': 'id', 'type': 'INTEGER'}],
-                'primary_key': ['id'],
-                'foreign_keys': [
-                    {
-                        'name': 'fk_user',
-                        'columns': ['nonexistent_col'],
-                        'ref_table': 'users',
-                        'ref_columns': ['id']
-                    }
-                ]
-            }
-        ]
-    }
-
-    with pytest.raises(SchemaValidationError, match="references non-existent column"):
-        validate_schema(schema)
-
-
-def test_validate_foreign_key_mismatched_column_counts():
-    """Test validation fails when foreign key has mismatched column counts."""
-    schema = {
-        'tables': [
-            {
-                'name': 'users',
-                'columns': [
-                    {'name': 'id', 'type': 'INTEGER'},
-                    {'name': 'email', 'type': 'VARCHAR(100)'}
-                ],
-                'primary_key': ['id']
-            },
-            {
-                'name': 'orders',
-                'columns': [
-                    {'name': 'id', 'type': 'INTEGER'},
-                    {'name': 'user_id', 'type': 'INTEGER'}
-                ],
-                'primary_key': ['id'],
-                'foreign_keys': [
-                    {
-                        'name': 'fk_user',
-                        'columns': ['user_id'],
-                        'ref_table': 'users',
-                        'ref_columns': ['id', 'email']  # Mismatch: 1 vs 2
-                    }
-                ]
-            }
-        ]
-    }
 
-    with pytest.raises(SchemaValidationError, match="mismatched column counts"):
+INVALID_CASES = [
+    pytest.param(
+        {'foo': 'bar'},
+        re.compile("must have 'tables' key"),
+        id='missing_tables_key'
+    ),
+    pytest.param(
+        "not a dict",
+        re.compile("must be a dictionary"),
+        id='schema_not_dict'
+    ),
+    pytest.param(
+        {'tables': 'not a list'},
+        re.compile("must be a list"),
+        id='tables_not_list'
+    ),
+    pytest.param(
+        _schema(_users(name=None)),
+        re.compile("must have 'name' field"),
+        id='table_missing_name'
+    ),
+    pytest.param(
+        _schema(_users(columns=None)),
+        re.compile("must have 'columns' field"),
+        id='table_missing_columns'
+    ),
+    pytest.param(
+        _schema(_users(primary_key=None)),
+        re.compile("must have 'primary_key' field"),
+        id='table_missing_primary_key'
+    ),
+    pytest.param(
+        _schema(_users(columns=[{'type': 'INTEGER'}], primary_key=[])),
+        re.compile("must have 'name' field"),
+        id='column_missing_name'
+    ),
+    pytest.param(
+        _schema(_users(columns=[{'name': 'id'}], primary_key=[])),
+        re.compile("must have 'type' field"),
+        id='column_missing_type'
+    ),
+    pytest.param(
+        _schema(_users(columns=[
+            {'name': 'id', 'type': 'INTEGER'},
+            {'name': 'id', 'type': 'VARCHAR(50)'}
+        ])),
+        re.compile("Duplicate column name"),
+        id='duplicate_column_names'
+    ),
+    pytest.param(
+        _schema(_users(primary_key=['nonexistent'])),
+        re.compile("Primary key column .* not found"),
+        id='primary_key_references_nonexistent_column'
+    ),
+    pytest.param(
+        _schema(_orders(['user_id'], ['id'])),
+        re.compile("references non-existent table"),
+        id='foreign_key_references_nonexistent_table'
+    ),
+    pytest.param(
+        _schema(_users(), _orders(['user_id'], ['nonexistent'])),
+        re.compile("references non-existent column"),
+        id='foreign_key_references_nonexistent_column'
+    ),
+    pytest.param(
+        _schema(_users(), _orders(['nonexistent_col'], ['id'], columns=('id',))),
+        re.compile("references non-existent column"),
+        id='foreign_key_local_column_doesnt_exist'
+    ),
+    pytest.param(
+        _schema(
+            _users(columns=[
+                {'name': 'id', 'type': 'INTEGER'},
+                {'name': 'email', 'type': 'VARCHAR(100)'}
+            ]),
+            _orders(['user_id'], ['id', 'email'])  # Mismatch: 1 vs 2
+        ),
+        re.compile("mismatched column counts"),
+        id='foreign_key_mismatched_column_counts'
+    ),
+]
+
+
+@pytest.mark.parametrize("schema,pattern", INVALID_CASES)
+def test_validate_invalid_schema(schema, pattern):
+    """Test validation fails with the expected error for invalid schemas."""
+    with pytest.raises(SchemaValidationError, match=pattern):
         validate_schema(schema)
 
 
@@ -1,11 +1,14 @@
 """Tests for YAML converter module."""
 
 import pytest
-import yaml
-import tempfile
-from pathlib import Path
-from src.reltools.converters.yaml_converter import ast_to_yaml, save_yaml, schema_to_dict
+from src.reltools.converters.yaml_converter import (
+    ast_to_yaml,
+    save_schema_yaml,
+    save_yaml,
+    schema_to_dict
+)
 from src.reltools.models.schema import Schema, Table, Column, ForeignKey
+from tests.yaml_helpers import load_yaml
 
 
 def test_ast_to_yaml_from_schema_object():
@@ -27,7 +30,7 @@ def test_ast_to_yaml_from_schema_object():
     yaml_str = ast_to_yaml(schema)
 
     # Parse back to verify structure
-    data = yaml.safe_load(yaml_str)
+    data = load_yaml(yaml_str)
 
     assert 'tables' in data
     assert len(data['tables']) == 1
@@ -69,7 +72,7 @@ def test_ast_to_yaml_with_foreign_keys():
     yaml_str = ast_to_yaml(schema)
 
     # Parse and verify
-    data = yaml.safe_load(yaml_str)
+    data = load_yaml(yaml_str)
 
     orders = data['tables'][1]
     assert orders['name'] == 'orders'
@@ -99,7 +102,7 @@ def test_ast_to_yaml_from_dict():
     }
 
     yaml_str = ast_to_yaml(schema_dict)
-    data = yaml.safe_load(yaml_str)
+    data = load_yaml(yaml_str)
 
     assert data == schema_dict
 
@@ -130,26 +133,33 @@ def test_schema_to_dict_omits_none_constraints():
     col_dict = result['tables'][0]['columns'][0]
     assert 'name' in col_dict
     assert 'type' in col_dict
-    assert 'constraints' not in col_dict or col_dict.get('constraints') is None
+    assert 'constraints' not in col_dict
 
 
-def test_save_yaml():
+def test_save_yaml(tmp_path):
     """Test saving YAML to file."""
     yaml_content = "tables:\n  - name: test\n"
+    temp_path = tmp_path / 'out.yaml'
 
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.yaml') as f:
-        temp_path = f.name
+    save_yaml(yaml_content, str(temp_path))
 
-    try:
-        save_yaml(yaml_content, temp_path)
+    # Read back and verify
+    assert temp_path.read_text(encoding='utf-8') == yaml_content
 
-        # Read back and verify
-        with open(temp_path, 'r') as f:
-            content = f.read()
 
-        assert content == yaml_content
-    finally:
-        Path(temp_path).unlink()
+def test_save_schema_yaml(tmp_path):
+    """Test streaming a Schema object straight to a YAML file."""
+    table = Table(
+        name='users',
+        columns=[Column(name='id', type='INTEGER')],
+        primary_key=['id']
+    )
+    schema = Schema(tables=[table])
+    temp_path = tmp_path / 'schema.yaml'
+
+    save_schema_yaml(schema, str(temp_path))
+
+    assert temp_path.read_text(encoding='utf-8') == ast_to_yaml(schema)
 
 
 def test_yaml_output_matches_expected_format():
@@ -189,7 +199,7 @@ def test_yaml_output_matches_expected_format():
     yaml_str = ast_to_yaml(schema)
 
     # Parse and verify structure matches README format
-    data = yaml.safe_load(yaml_str)
+    data = load_yaml(yaml_str)
 
     assert 'tables' in data
     assert data['tables'][0]['name'] == 'users'
@@ -0,0 +1,13 @@
+"""YAML helpers shared by the test suite."""
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+def load_yaml(stream):
+    """Safely load YAML, using libyaml when available."""
+    return yaml.load(stream, Loader=_Loader)